@@ -1,7 +1,10 @@
 import argparse
 import asyncio
+import ctypes
+import ctypes.util
 import logging
 import os
+import re
 import sys
 from functools import partial
 from urllib.parse import urlparse
@@ -11,10 +14,36 @@ from wyoming.server import AsyncTcpServer
 
 from . import __version__
 from .supertonic_engine import SupertonicEngine
-from .handler import SupertonicEventHandler
+from .handler import SupertonicEventHandler, serialize_event
 
 _LOGGER = logging.getLogger(__name__)
 
+_VOICE_RE = re.compile(r"^([MF])(\d+)$")
+
+# mallopt() parameter from glibc's malloc.h
+_M_ARENA_MAX = -8
+
+
+def _tune_env(threads: int) -> None:
+    """Set threading/allocator knobs. Must run before onnxruntime is imported."""
+    os.environ.setdefault("OMP_NUM_THREADS", str(threads))
+    os.environ.setdefault("OMP_WAIT_POLICY", "ACTIVE")
+    os.environ.setdefault("KMP_AFFINITY", "granularity=fine,compact,1,0")
+    os.environ.setdefault("KMP_BLOCKTIME", "1")
+
+    # MALLOC_ARENA_MAX is only read at process start, so apply it via mallopt
+    if sys.platform.startswith("linux"):
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"))
+            if libc.mallopt(_M_ARENA_MAX, 2):
+                _LOGGER.debug("Limited malloc arenas to 2")
+        except (OSError, AttributeError, TypeError):
+            pass
+
+    if "jemalloc" in os.environ.get("LD_PRELOAD", ""):
+        _LOGGER.info("Using jemalloc allocator")
+
+
 async def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--uri", default="tcp://0.0.0.0:10209", help="Server URI")
@@ -23,6 +52,7 @@ async def main() -> None:
     parser.add_argument("--steps", type=int, default=5, help="Denoising steps")
     parser.add_argument("--speed", type=float, default=1.0, help="Speech speed")
     parser.add_argument("--threads", type=int, default=4, help="CPU threads")
+    parser.add_argument("--quantize", action="store_true", help="Use int8-quantized models")
     parser.add_argument("--no-streaming", action="store_true", help="Disable streaming")
     parser.add_argument("--debug", action="store_true", help="Debug logs")
     parser.add_argument("--log-format", default=logging.BASIC_FORMAT, help="Log format")
@@ -32,12 +62,11 @@ async def main() -> None:
 
     logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO, format=args.log_format)
     
-    os.environ["SUPERTONIC_INTRA_OP_THREADS"] = str(args.threads)
-    os.environ["SUPERTONIC_INTER_OP_THREADS"] = str(max(1, args.threads // 2))
+    _tune_env(args.threads)
 
     _LOGGER.info("Initializing Supertonic V2 standalone engine...")
     
-    engine = SupertonicEngine(steps=args.steps, speed=args.speed, model_path=args.data_dir)
+    engine = SupertonicEngine(steps=args.steps, speed=args.speed, model_path=args.data_dir, quantize=args.quantize, threads=args.threads)
     
     try:
         await asyncio.to_thread(engine.load)
@@ -50,10 +79,10 @@ async def main() -> None:
     
     for voice_id in engine.available_voices:
         readable_name = voice_id
-        if voice_id.startswith("M") and voice_id[1:].isdigit():
-            readable_name = f"Male {voice_id[1:]}"
-        elif voice_id.startswith("F") and voice_id[1:].isdigit():
-            readable_name = f"Female {voice_id[1:]}"
+        match = _VOICE_RE.match(voice_id)
+        if match:
+            gender = "Male" if match[1] == "M" else "Female"
+            readable_name = f"{gender} {match[2]}"
             
         wyoming_voices.append(
             TtsVoice(
@@ -91,7 +120,7 @@ async def main() -> None:
 
     handler_factory = partial(
         SupertonicEventHandler,
-        wyoming_info,
+        serialize_event(wyoming_info.event()),
         args,
         engine,
     )
@@ -104,7 +133,16 @@ async def main() -> None:
 
 def run():
     try:
-        asyncio.run(main())
+        import uvloop
+    except ImportError:
+        uvloop = None
+
+    try:
+        # uvloop.run was added in 0.18
+        if hasattr(uvloop, "run"):
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         pass
 
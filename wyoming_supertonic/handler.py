@@ -1,12 +1,15 @@
 import argparse
 import asyncio
+import io
 import logging
+import socket
+from typing import Optional
 
 from sentence_stream import SentenceBoundaryDetector
 from wyoming.audio import AudioChunk, AudioStart, AudioStop
 from wyoming.error import Error
-from wyoming.event import Event
-from wyoming.info import Describe, Info
+from wyoming.event import Event, write_event
+from wyoming.info import Describe
 from wyoming.server import AsyncEventHandler
 from wyoming.tts import (
     Synthesize,
@@ -20,12 +23,26 @@ from .supertonic_engine import SupertonicEngine
 
 _LOGGER = logging.getLogger(__name__)
 
+# Audio chunk frames written before waiting for the socket to drain
+_FRAMES_PER_DRAIN = 16
+
+# Sentences per inference call for full-text requests
+_BATCH_SIZE = 8
+
+
+def serialize_event(event: Event) -> bytes:
+    """Serialize an event to its Wyoming wire format."""
+    buf = io.BytesIO()
+    write_event(event, buf)
+    return buf.getvalue()
+
+
 class SupertonicEventHandler(AsyncEventHandler):
     """Event handler for Supertonic TTS."""
 
     def __init__(
         self,
-        wyoming_info: Info,
+        info_event_bytes: bytes,
         cli_args: argparse.Namespace,
         engine: SupertonicEngine,
         reader: asyncio.StreamReader,
@@ -35,8 +52,16 @@ class SupertonicEventHandler(AsyncEventHandler):
     ) -> None:
         super().__init__(reader=reader, writer=writer, *args, **kwargs)
         
+        # Don't let Nagle's algorithm hold back small audio chunks
+        sock = writer.get_extra_info("socket")
+        if sock is not None and sock.family in (socket.AF_INET, socket.AF_INET6):
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except OSError:
+                _LOGGER.debug("Could not set TCP_NODELAY", exc_info=True)
+
         self.cli_args = cli_args
-        self.wyoming_info_event = wyoming_info.event()
+        self.info_event_bytes = info_event_bytes
         self.engine = engine
         
         self.sbd = SentenceBoundaryDetector()
@@ -45,10 +70,17 @@ class SupertonicEventHandler(AsyncEventHandler):
         self._current_voice = None 
         self._current_language = self.cli_args.language
 
+        # Streaming: sentences are queued as executor futures and written in order
+        # by a background task, so synthesis of the next sentence overlaps sending
+        self._audio_queue: Optional[asyncio.Queue] = None
+        self._audio_writer: Optional[asyncio.Task] = None
+
     async def handle_event(self, event: Event) -> bool:
         """Handle incoming Wyoming event."""
         if Describe.is_type(event.type):
-            await self.write_event(self.wyoming_info_event)
+            # Pre-serialized once at startup
+            self.writer.write(self.info_event_bytes)
+            await self.writer.drain()
             return True
 
         try:
@@ -66,7 +98,7 @@ class SupertonicEventHandler(AsyncEventHandler):
                 if lang: 
                     self._current_language = lang
                 
-                _LOGGER.debug(f"Synthesize request. Voice: {self._current_voice}, Lang: {self._current_language}")
+                _LOGGER.debug("Synthesize request. Voice: %s, Lang: %s", self._current_voice, self._current_language)
                 return await self._handle_synthesize_full(syn.text)
 
             # --- 2. Start Streaming ---
@@ -79,7 +111,7 @@ class SupertonicEventHandler(AsyncEventHandler):
                 
                 self._is_streaming = True
                 self._audio_started = False
-                self.sbd = SentenceBoundaryDetector()
+                self._reset_sbd()
                 
                 if start.voice and start.voice.name:
                     self._current_voice = start.voice.name
@@ -87,7 +119,7 @@ class SupertonicEventHandler(AsyncEventHandler):
                 if lang:
                     self._current_language = lang
                 
-                _LOGGER.debug(f"Stream started. Voice: {self._current_voice}, Language: {self._current_language}")
+                _LOGGER.debug("Stream started. Voice: %s, Language: %s", self._current_voice, self._current_language)
                 return True
 
             # --- 3. Chunk ---
@@ -105,6 +137,8 @@ class SupertonicEventHandler(AsyncEventHandler):
                 remaining = self.sbd.finish()
                 if remaining:
                     await self._process_sentence(remaining)
+
+                await self._finish_audio_writer()
                 
                 if self._audio_started:
                     await self.write_event(AudioStop().event())
@@ -117,25 +151,32 @@ class SupertonicEventHandler(AsyncEventHandler):
             _LOGGER.exception("Handler error")
             await self.write_event(Error(text=str(err), code=err.__class__.__name__).event())
             self._is_streaming = False
+            self._cancel_audio_writer()
 
         return True
 
     async def _handle_synthesize_full(self, text: str) -> bool:
         """Process a complete text synthesis request."""
         self._audio_started = False
-        self.sbd = SentenceBoundaryDetector()
+        self._reset_sbd()
         
         sentences = list(self.sbd.add_chunk(text))
         remaining = self.sbd.finish()
         if remaining: sentences.append(remaining)
         
-        for s in sentences:
-            await self._process_sentence(s)
+        # The whole text is known up front, so synthesize it in batches
+        sentences = [s.strip() for s in sentences if s.strip()]
+        if sentences:
+            await self._synthesize_batch(sentences)
         
         if self._audio_started:
             await self.write_event(AudioStop().event())
         return True
 
+    def _reset_sbd(self) -> None:
+        """Discard any text left in the boundary detector from a previous request."""
+        self.sbd.finish()
+
     async def _process_sentence(self, sentence: str):
         """Process a single sentence detected by the boundary detector."""
         s = sentence.strip()
@@ -143,31 +184,135 @@ class SupertonicEventHandler(AsyncEventHandler):
         
         await self._synthesize_text(s)
 
-    async def _synthesize_text(self, text: str):
-        """Synthesize text to audio and stream chunks."""
+    def _resolve_voice(self) -> str:
         voice_name = "M1"
         if self._current_voice and self._current_voice in self.engine.available_voices:
              voice_name = self._current_voice
         elif self.engine.available_voices:
              voice_name = self.engine.available_voices[0]
+        return voice_name
+
+    async def _synthesize_text(self, text: str):
+        """Queue text for synthesis; audio is sent by the writer task in order."""
+        voice_name = self._resolve_voice()
 
-        _LOGGER.debug(f"Requesting synthesis for: '{text[:40]}...' [Lang: {self._current_language}]")
+        _LOGGER.debug("Requesting synthesis for: '%s...' [Lang: %s]", text[:40], self._current_language)
 
         loop = asyncio.get_running_loop()
-        try:
-            pcm_bytes, rate = await loop.run_in_executor(
-                None, self.engine.synthesize, text, voice_name, self._current_language
-            )
-        except Exception as e:
-            _LOGGER.error(f"Engine error: {e}")
+        pending = loop.run_in_executor(
+            self.engine.executor, self.engine.synthesize, text, voice_name, self._current_language
+        )
+
+        if self._audio_writer is None:
+            self._audio_queue = asyncio.Queue()
+            self._audio_writer = asyncio.create_task(self._write_queued_audio(self._audio_queue))
+
+        self._audio_queue.put_nowait(pending)
+
+    async def _write_queued_audio(self, queue: asyncio.Queue):
+        """Send queued synthesis results in order until a None sentinel arrives."""
+        while True:
+            pending = await queue.get()
+            if pending is None:
+                return
+
+            try:
+                pcm_bytes, rate = await pending
+            except Exception as e:
+                _LOGGER.error("Engine error: %s", e)
+                continue
+
+            await self._write_audio(pcm_bytes, rate)
+
+    async def _finish_audio_writer(self):
+        """Wait until all queued audio has been sent."""
+        if self._audio_writer is None:
             return
 
+        writer_task = self._audio_writer
+        self._audio_queue.put_nowait(None)
+        self._audio_writer = None
+        self._audio_queue = None
+        await writer_task
+
+    def _cancel_audio_writer(self):
+        """Stop sending audio and drop synthesis jobs that haven't started yet."""
+        if self._audio_writer is None:
+            return
+
+        # Cancelling a run_in_executor future also cancels the queued executor job
+        while not self._audio_queue.empty():
+            pending = self._audio_queue.get_nowait()
+            if pending is not None:
+                pending.cancel()
+
+        self._audio_writer.cancel()
+        self._audio_writer = None
+        self._audio_queue = None
+
+    async def disconnect(self) -> None:
+        self._cancel_audio_writer()
+        await super().disconnect()
+
+    async def _synthesize_batch(self, texts: list[str]):
+        """Synthesize several sentences in batched inference calls and stream chunks."""
+        voice_name = self._resolve_voice()
+
+        _LOGGER.debug("Requesting batch synthesis for %s sentences [Lang: %s]", len(texts), self._current_language)
+
+        # Keep input order; the first sentence goes alone so audio starts as early as before
+        groups = [texts[:1]] + [
+            texts[i : i + _BATCH_SIZE] for i in range(1, len(texts), _BATCH_SIZE)
+        ]
+
+        loop = asyncio.get_running_loop()
+
+        def submit(group: list[str]) -> asyncio.Future:
+            return loop.run_in_executor(
+                self.engine.executor, self.engine.synthesize_batch, group, voice_name, self._current_language, _BATCH_SIZE
+            )
+
+        # Synthesize the next group while the current one is being sent
+        pending = submit(groups[0])
+        try:
+            for next_group in groups[1:] + [None]:
+                try:
+                    pcm_list, rate = await pending
+                except Exception as e:
+                    # Skip the failed group but keep going with the rest
+                    _LOGGER.error("Engine error: %s", e)
+                    pcm_list = []
+
+                pending = submit(next_group) if next_group is not None else None
+
+                for pcm_bytes in pcm_list:
+                    await self._write_audio(pcm_bytes, rate)
+        finally:
+            # Don't leave the next group running on the shared executor if sending failed
+            if pending is not None:
+                pending.cancel()
+
+    async def _write_audio(self, pcm_bytes: bytes, rate: int):
+        """Send synthesized PCM as audio chunks."""
         if not self._audio_started:
             await self.write_event(AudioStart(rate=rate, width=2, channels=1).event())
             self._audio_started = True
 
-        chunk_size = 2048
-        for i in range(0, len(pcm_bytes), chunk_size):
-            await self.write_event(
-                AudioChunk(audio=pcm_bytes[i : i + chunk_size], rate=rate, width=2, channels=1).event()
+        # Larger chunks mean fewer events to frame and send
+        chunk_size = 8192
+        pcm_view = memoryview(pcm_bytes)
+        frames: list[bytes] = []
+        for i in range(0, len(pcm_view), chunk_size):
+            frames.append(
+                serialize_event(
+                    AudioChunk(audio=bytes(pcm_view[i : i + chunk_size]), rate=rate, width=2, channels=1).event()
+                )
             )
+            if len(frames) >= _FRAMES_PER_DRAIN:
+                self.writer.writelines(frames)
+                await self.writer.drain()
+                frames.clear()
+
+        if frames:
+            self.writer.writelines(frames)
+            await self.writer.drain()
@@ -1,5 +1,9 @@
+import hashlib
 import json
+import logging
 import os
+import platform
+import shutil
 import time
 from contextlib import contextmanager
 from typing import Optional
@@ -10,6 +14,8 @@ import onnxruntime as ort
 
 import re
 
+_LOGGER = logging.getLogger(__name__)
+
 AVAILABLE_LANGS = ["en", "ko", "es", "pt", "fr"]
 
 
@@ -153,6 +159,7 @@ class TextToSpeech:
         self.text_enc_ort = text_enc_ort
         self.vector_est_ort = vector_est_ort
         self.vocoder_ort = vocoder_ort
+        self.vector_est_output_name = vector_est_ort.get_outputs()[0].name
         self.sample_rate = cfgs["ae"]["sample_rate"]
         self.base_chunk_size = cfgs["ae"]["base_chunk_size"]
         self.chunk_compress_factor = cfgs["ttl"]["chunk_compress_factor"]
@@ -197,20 +204,27 @@ class TextToSpeech:
         )  # dur_onnx: [bsz]
         xt, latent_mask = self.sample_noisy_latent(dur_onnx)
         total_step_np = np.array([total_step] * bsz, dtype=np.float32)
+        # Inputs that stay constant across denoising steps are bound once
+        io_binding = self.vector_est_ort.io_binding()
+        io_binding.bind_cpu_input("text_emb", text_emb_onnx)
+        io_binding.bind_cpu_input("style_ttl", style.ttl)
+        io_binding.bind_cpu_input("text_mask", text_mask)
+        io_binding.bind_cpu_input("latent_mask", latent_mask)
+        io_binding.bind_cpu_input("total_step", total_step_np)
+        # The latent stays in two preallocated OrtValues that swap roles each step
+        xt = np.ascontiguousarray(xt, dtype=np.float32)
+        latent_in = ort.OrtValue.ortvalue_from_numpy(xt)
+        latent_out = ort.OrtValue.ortvalue_from_shape_and_type(
+            xt.shape, np.float32
+        )
         for step in range(total_step):
             current_step = np.array([step] * bsz, dtype=np.float32)
-            xt, *_ = self.vector_est_ort.run(
-                None,
-                {
-                    "noisy_latent": xt,
-                    "text_emb": text_emb_onnx,
-                    "style_ttl": style.ttl,
-                    "text_mask": text_mask,
-                    "latent_mask": latent_mask,
-                    "current_step": current_step,
-                    "total_step": total_step_np,
-                },
-            )
+            io_binding.bind_ortvalue_input("noisy_latent", latent_in)
+            io_binding.bind_cpu_input("current_step", current_step)
+            io_binding.bind_ortvalue_output(self.vector_est_output_name, latent_out)
+            self.vector_est_ort.run_with_iobinding(io_binding)
+            latent_in, latent_out = latent_out, latent_in
+        xt = latent_in.numpy()
         wav, *_ = self.vocoder_ort.run(None, {"latent": xt})
         return wav, dur_onnx
 
@@ -280,10 +294,180 @@ def get_latent_mask(
     return latent_mask
 
 
+def cpu_fingerprint() -> str:
+    """Short hash identifying this machine's CPU model and instruction set."""
+    parts = {"machine": platform.machine(), "processor": platform.processor()}
+    try:
+        with open("/proc/cpuinfo", "r") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                key = key.strip()
+                if key in ("model name", "flags", "Features", "CPU part"):
+                    parts.setdefault(key, value.strip())
+    except OSError:
+        pass
+    text = "\n".join(f"{k}={v}" for k, v in sorted(parts.items()))
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:12]
+
+
+def get_ort_cache_dir(onnx_dir: str) -> Optional[str]:
+    """
+    Return a writable directory for optimized models, or None.
+
+    Fully optimized graphs contain hardware-specific kernels, so the directory
+    is keyed by the ORT version and the CPU that produced them.
+    """
+    cache_dir = os.path.join(
+        onnx_dir, ".ort_cache", f"{ort.__version__}-{cpu_fingerprint()}"
+    )
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+    except OSError:
+        return None
+    return cache_dir if os.access(cache_dir, os.W_OK) else None
+
+
+def remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def save_optimized_model(
+    onnx_path: str,
+    cache_path: str,
+    opts: ort.SessionOptions,
+    providers: list[str],
+) -> ort.InferenceSession:
+    """
+    Load an ONNX model and save its optimized graph in ORT format.
+
+    The file is written next to cache_path first and moved into place once
+    complete. Failing to write the cache is not an error.
+
+    Returns:
+        The session created while optimizing
+    """
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp.ort"
+    opts.optimized_model_filepath = tmp_path
+    try:
+        session = ort.InferenceSession(
+            onnx_path, sess_options=opts, providers=providers
+        )
+    finally:
+        opts.optimized_model_filepath = ""
+
+    try:
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        _LOGGER.warning("Could not cache optimized model %s: %s", onnx_path, e)
+        remove_file(tmp_path)
+    return session
+
+
+def load_cached_onnx(
+    cache_path: str, opts: ort.SessionOptions, providers: list[str]
+) -> Optional[ort.InferenceSession]:
+    """Load an optimized model, deleting it if it cannot be read."""
+    try:
+        return ort.InferenceSession(cache_path, sess_options=opts, providers=providers)
+    except Exception as e:
+        _LOGGER.warning("Discarding unreadable optimized model %s: %s", cache_path, e)
+        remove_file(cache_path)
+        return None
+
+
 def load_onnx(
-    onnx_path: str, opts: ort.SessionOptions, providers: list[str]
+    onnx_path: str,
+    opts: ort.SessionOptions,
+    providers: list[str],
+    cache_dir: Optional[str] = None,
 ) -> ort.InferenceSession:
-    return ort.InferenceSession(onnx_path, sess_options=opts, providers=providers)
+    if cache_dir is None:
+        return ort.InferenceSession(onnx_path, sess_options=opts, providers=providers)
+
+    name = os.path.splitext(os.path.basename(onnx_path))[0]
+    cache_path = os.path.join(cache_dir, f"{name}.ort")
+
+    if os.path.exists(cache_path) and os.path.getmtime(
+        cache_path
+    ) >= os.path.getmtime(onnx_path):
+        session = load_cached_onnx(cache_path, opts, providers)
+        if session is not None:
+            return session
+
+    return save_optimized_model(onnx_path, cache_path, opts, providers)
+
+
+ONNX_MODEL_NAMES = [
+    "duration_predictor",
+    "text_encoder",
+    "vector_estimator",
+    "vocoder",
+]
+
+# Only matrix multiplications are quantized: dynamic ConvInteger kernels are
+# much slower than FP32 Conv on CPU, and the vocoder is mostly convolutions
+QUANTIZE_OP_TYPES = ["MatMul", "Gemm"]
+
+
+def quantize_models(onnx_dir: str) -> str:
+    """
+    Write dynamically int8-quantized copies of the models to onnx_dir/int8.
+
+    Copies are only rebuilt when the source model is newer or the quantization
+    settings have changed.
+
+    Returns:
+        Directory that can be passed to load_text_to_speech
+    """
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    int8_dir = os.path.join(onnx_dir, "int8")
+    os.makedirs(int8_dir, exist_ok=True)
+
+    # Copies made with different settings are stale regardless of mtime
+    stamp_path = os.path.join(int8_dir, ".quantize")
+    stamp = ",".join(QUANTIZE_OP_TYPES)
+    try:
+        with open(stamp_path, "r") as f:
+            settings_changed = f.read().strip() != stamp
+    except OSError:
+        settings_changed = True
+
+    for name in ONNX_MODEL_NAMES:
+        src = os.path.join(onnx_dir, f"{name}.onnx")
+        dst = os.path.join(int8_dir, f"{name}.onnx")
+        if (
+            not settings_changed
+            and os.path.exists(dst)
+            and os.path.getmtime(dst) >= os.path.getmtime(src)
+        ):
+            continue
+        _LOGGER.info("Quantizing %s.onnx to int8", name)
+
+        # Write to a temporary file so an interrupted run never leaves a partial model
+        tmp_path = f"{dst}.{os.getpid()}.tmp"
+        try:
+            quantize_dynamic(
+                src,
+                tmp_path,
+                op_types_to_quantize=QUANTIZE_OP_TYPES,
+                weight_type=QuantType.QInt8,
+            )
+            os.replace(tmp_path, dst)
+        finally:
+            remove_file(tmp_path)
+
+    with open(stamp_path, "w") as f:
+        f.write(stamp)
+
+    # Configs are loaded from the same directory as the models
+    for name in ["tts.json", "unicode_indexer.json"]:
+        shutil.copy2(os.path.join(onnx_dir, name), os.path.join(int8_dir, name))
+
+    return int8_dir
 
 
 def load_onnx_all(
@@ -299,10 +483,11 @@ def load_onnx_all(
     vector_est_onnx_path = os.path.join(onnx_dir, "vector_estimator.onnx")
     vocoder_onnx_path = os.path.join(onnx_dir, "vocoder.onnx")
 
-    dp_ort = load_onnx(dp_onnx_path, opts, providers)
-    text_enc_ort = load_onnx(text_enc_onnx_path, opts, providers)
-    vector_est_ort = load_onnx(vector_est_onnx_path, opts, providers)
-    vocoder_ort = load_onnx(vocoder_onnx_path, opts, providers)
+    cache_dir = get_ort_cache_dir(onnx_dir)
+    dp_ort = load_onnx(dp_onnx_path, opts, providers, cache_dir)
+    text_enc_ort = load_onnx(text_enc_onnx_path, opts, providers, cache_dir)
+    vector_est_ort = load_onnx(vector_est_onnx_path, opts, providers, cache_dir)
+    vocoder_ort = load_onnx(vocoder_onnx_path, opts, providers, cache_dir)
     return dp_ort, text_enc_ort, vector_est_ort, vocoder_ort
 
 
@@ -319,8 +504,37 @@ def load_text_processor(onnx_dir: str) -> UnicodeProcessor:
     return text_processor
 
 
-def load_text_to_speech(onnx_dir: str, use_gpu: bool = False) -> TextToSpeech:
+def register_shared_allocator() -> None:
+    """Register a process-wide CPU arena that sessions can share."""
+    mem_info = ort.OrtMemoryInfo(
+        "Cpu", ort.OrtAllocatorType.ORT_ARENA_ALLOCATOR, 0, ort.OrtMemType.DEFAULT
+    )
+    try:
+        ort.create_and_register_allocator(mem_info, None)
+    except Exception:
+        # Normally means it is already registered in this process
+        _LOGGER.debug("Could not register shared CPU allocator", exc_info=True)
+
+
+def create_session_options(intra_op_threads: Optional[int] = None) -> ort.SessionOptions:
     opts = ort.SessionOptions()
+    if intra_op_threads:
+        opts.intra_op_num_threads = intra_op_threads
+    opts.inter_op_num_threads = 1
+    opts.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    opts.enable_mem_pattern = True
+    opts.enable_cpu_mem_arena = True
+    # All sub-models allocate from the shared arena registered above
+    opts.add_session_config_entry("session.use_env_allocators", "1")
+    return opts
+
+
+def load_text_to_speech(
+    onnx_dir: str, use_gpu: bool = False, intra_op_threads: Optional[int] = None
+) -> TextToSpeech:
+    register_shared_allocator()
+    opts = create_session_options(intra_op_threads)
     if use_gpu:
         raise NotImplementedError("GPU mode is not fully tested")
     else:
@@ -1,34 +1,64 @@
+import concurrent.futures
 import logging
 import numpy as np
 import os
 import sys
+import threading
+from typing import Any
 
 # Add current directory to path to find helper.py
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 _LOGGER = logging.getLogger(__name__)
 
+# Largest int16 scratch buffer kept between calls (~30 s at 44.1 kHz, ~2.6 MB)
+_MAX_PCM_SCRATCH_SAMPLES = 44100 * 30
+
 class SupertonicEngine:
-    def __init__(self, steps: int = 5, speed: float = 1.05, model_path: str = None):
+    def __init__(self, steps: int = 5, speed: float = 1.05, model_path: str = None, quantize: bool = False, threads: int = None):
         self.steps = steps
         self.speed = speed
         self.model_path = model_path
+        self.quantize = quantize
+        self.threads = threads
         self.tts = None
         self.sample_rate = 44100 
         self.available_voices = []
         
         self._load_style_func = None
+        self._style_cls = None
+        self._style_cache: dict[str, Any] = {}
+        self._style_lock = threading.Lock()
+
+        # ORT sessions are shared, so only one inference may run at a time
+        self._lock = threading.Lock()
+
+        # Reused int16 output buffer, grown on demand up to _MAX_PCM_SCRATCH_SAMPLES.
+        # The lock guards reuse in case synthesis is called outside the executor.
+        self._pcm_scratch = np.empty(0, dtype=np.int16)
+        self._pcm_lock = threading.Lock()
         
+        # ONNX Runtime already parallelises each run; serialise synthesis calls
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="supertonic"
+        )
+
         # Supported V2 model languages
         self.supported_langs = ["en", "ko", "es", "pt", "fr"]
 
+    @property
+    def executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Executor that synthesis calls should be dispatched to."""
+        return self._executor
+
     def load(self):
         """Load via local helper.py"""
         _LOGGER.info("Loading engine (standalone mode)...")
         
         try:
-            from helper import load_text_to_speech, load_voice_style
+            from helper import Style, load_text_to_speech, load_voice_style, quantize_models
             self._load_style_func = load_voice_style
+            self._style_cls = Style
             
             # Locate folders
             base_dir = self.model_path if self.model_path else os.getcwd()
@@ -43,10 +73,16 @@ class SupertonicEngine:
                 else:
                     raise FileNotFoundError(f"Folder 'onnx' not found in {base_dir}")
 
+            if self.quantize:
+                try:
+                    onnx_dir = quantize_models(onnx_dir)
+                except Exception as e:
+                    _LOGGER.warning("Quantization failed, using FP32 models: %s", e)
+
             _LOGGER.info(f"Loading ONNX models from: {onnx_dir}")
             
             # Load (use_gpu=False)
-            self.tts = load_text_to_speech(onnx_dir, use_gpu=False)
+            self.tts = load_text_to_speech(onnx_dir, use_gpu=False, intra_op_threads=self.threads)
             
             if hasattr(self.tts, 'sample_rate'):
                 self.sample_rate = self.tts.sample_rate
@@ -65,40 +101,154 @@ class SupertonicEngine:
         except ImportError as e:
             raise RuntimeError(f"helper.py not found! {e}")
 
-    def synthesize(self, text: str, voice_name: str, lang_code: str = "en") -> tuple[bytes, int]:
-        if self.tts is None:
-            raise RuntimeError("Engine not loaded!")
+    def _get_style(self, voice_name: str) -> Any:
+        """Return the parsed style for a voice, loading it on first use."""
+        style = self._style_cache.get(voice_name)
+        if style is not None:
+            return style
 
-        # 1. Process language
+        with self._style_lock:
+            style = self._style_cache.get(voice_name)
+            if style is None:
+                style_path = os.path.join(self.styles_dir, f"{voice_name}.json")
+                style = self._load_style_func([style_path])
+                self._style_cache[voice_name] = style
+        return style
+
+    def _resolve_lang(self, lang_code: str) -> str:
         if not lang_code: lang_code = "en"
         short_lang = lang_code[:2].lower()
         if short_lang not in self.supported_langs:
             short_lang = "en"
+        return short_lang
 
-        # 2. Load style
-        style_path = os.path.join(self.styles_dir, f"{voice_name}.json")
-        style = self._load_style_func([style_path])
+    def _to_pcm(self, wav: np.ndarray) -> bytes:
+        """Convert float audio in [-1, 1] to int16 PCM bytes.
+
+        The input is scaled in place when it is already contiguous float32, so
+        callers must pass an array they own and no longer need.
+        """
+        wav = np.ascontiguousarray(wav, dtype=np.float32).reshape(-1)
+        n = wav.shape[0]
+
+        # In place, no temporaries
+        np.multiply(wav, 32767.0, out=wav)
+        np.rint(wav, out=wav)
+        np.clip(wav, -32768.0, 32767.0, out=wav)
+
+        if n > _MAX_PCM_SCRATCH_SAMPLES:
+            # Don't pin memory for rare long utterances; use a one-off buffer
+            return wav.astype(np.int16).tobytes()
+
+        with self._pcm_lock:
+            if self._pcm_scratch.shape[0] < n:
+                self._pcm_scratch = np.empty(n, dtype=np.int16)
+            pcm = self._pcm_scratch[:n]
+            np.copyto(pcm, wav, casting="unsafe")
+            return pcm.tobytes()
+
+    def synthesize(self, text: str, voice_name: str, lang_code: str = "en") -> tuple[bytes, int]:
+        if self.tts is None:
+            raise RuntimeError("Engine not loaded!")
+
+        # 1. Process language
+        short_lang = self._resolve_lang(lang_code)
+
+        # 2. Load style (parsed once per voice)
+        style = self._get_style(voice_name)
 
         # 3. Synthesize via helper
         try:
-            _LOGGER.debug(f"Synthesizing: (Voice: {voice_name}, Lang: {short_lang}, Speed: {self.speed}, Steps: {self.steps})")
+            _LOGGER.debug("Synthesizing: (Voice: %s, Lang: %s, Speed: %s, Steps: %s)", voice_name, short_lang, self.speed, self.steps)
             
-            wav, duration = self.tts(
-                text,       
-                short_lang, 
-                style, 
-                self.steps, 
-                self.speed
-            )
+            with self._lock:
+                wav, duration = self.tts(
+                    text,       
+                    short_lang, 
+                    style, 
+                    self.steps, 
+                    self.speed
+                )
             
             # Remove batch dimensions (1, N) -> (N,)
             wav = wav.squeeze()
             
         except Exception as e:
-            _LOGGER.error(f"Synthesis error in helper: {e}")
+            _LOGGER.error("Synthesis error in helper: %s", e)
             raise e
 
         # 4. Simple conversion to int16 without trimming
-        audio_int16 = (wav * 32767).clip(-32768, 32767).astype(np.int16)
-        
-        return audio_int16.tobytes(), self.sample_rate
\ No newline at end of file
+        return self._to_pcm(wav), self.sample_rate
+
+    def synthesize_batch(
+        self,
+        texts: list[str],
+        voice_name: str,
+        lang_code: str = "en",
+        max_batch_size: int = 8,
+    ) -> tuple[list[bytes], int]:
+        """Synthesize several texts with one ONNX run per sub-batch.
+
+        Sub-batches are consecutive runs of the input texts, and audio is
+        returned in input order. Texts too long for a single model pass go
+        through synthesize(), which splits them like the helper does.
+        """
+        if self.tts is None:
+            raise RuntimeError("Engine not loaded!")
+
+        short_lang = self._resolve_lang(lang_code)
+        style = self._get_style(voice_name)
+
+        # Same limit TextToSpeech.__call__ passes to chunk_text
+        max_len = 120 if short_lang == "ko" else 300
+
+        results: list[bytes] = []
+        batch_texts: list[str] = []
+
+        for text in texts:
+            if len(text) > max_len:
+                results.extend(self._infer_batch(batch_texts, voice_name, short_lang, style))
+                batch_texts = []
+                results.append(self.synthesize(text, voice_name, short_lang)[0])
+                continue
+
+            batch_texts.append(text)
+            if len(batch_texts) >= max_batch_size:
+                results.extend(self._infer_batch(batch_texts, voice_name, short_lang, style))
+                batch_texts = []
+
+        results.extend(self._infer_batch(batch_texts, voice_name, short_lang, style))
+
+        return results, self.sample_rate
+
+    def _infer_batch(self, batch_texts: list[str], voice_name: str, short_lang: str, style: Any) -> list[bytes]:
+        """Run one batched inference and return PCM for each text."""
+        bsz = len(batch_texts)
+        if not bsz:
+            return []
+
+        batch_style = self._style_cls(
+            np.repeat(style.ttl, bsz, axis=0), np.repeat(style.dp, bsz, axis=0)
+        )
+
+        try:
+            _LOGGER.debug("Synthesizing batch of %s (Voice: %s, Lang: %s)", bsz, voice_name, short_lang)
+            with self._lock:
+                wav, duration = self.tts.batch(
+                    batch_texts,
+                    [short_lang] * bsz,
+                    batch_style,
+                    self.steps,
+                    self.speed,
+                )
+        except Exception as e:
+            _LOGGER.error("Synthesis error in helper: %s", e)
+            raise e
+
+        # Drop the padding each item received from longer batch members
+        lengths = (duration * self.sample_rate).astype(np.int64)
+        results = []
+        for row in range(bsz):
+            n = min(int(lengths[row]), wav.shape[-1])
+            results.append(self._to_pcm(wav[row, :n]))
+        return results